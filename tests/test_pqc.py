@@ -8,10 +8,12 @@ These tests verify that:
 4. Client and server can use PQC
 """
 
+import asyncio
+import os
 import pytest
 import ssl
-from unittest.mock import patch, MagicMock
 
+from arc import Client, Server
 from arc.crypto import (
     verify_kyber_support,
     create_quantum_safe_context,
@@ -23,6 +25,60 @@ from arc.crypto import (
 )
 
 
+# Detect PQC once at collection time so unavailable tests skip before setup
+PQC_SUPPORT = verify_kyber_support()
+
+requires_pqc = pytest.mark.skipif(
+    not PQC_SUPPORT["available"],
+    reason="PQC libraries not available"
+)
+
+# Shared configs; tests only read them, so one instance each is enough
+DEFAULT_CONFIG = HybridTLSConfig()
+CUSTOM_CONFIG = HybridTLSConfig(
+    kyber_variant=1024,
+    classical_curve="x25519",
+    verify_mode=ssl.CERT_NONE,
+    check_hostname=False
+)
+KYBER512_CONFIG = HybridTLSConfig(
+    kyber_variant=512,
+    classical_curve="x25519"
+)
+
+
+@pytest.fixture(scope="module")
+def client_loop():
+    """Share one event loop for closing the module's clients."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(True, id="pqc", marks=requires_pqc),
+        pytest.param(False, id="standard")
+    ]
+)
+def pqc_client(request, client_loop):
+    """Build one client per ``use_quantum_safe`` setting for the module."""
+    client = Client(
+        endpoint="https://example.com",
+        token="test-token",
+        use_quantum_safe=request.param
+    )
+    yield client
+    client_loop.run_until_complete(client.close())
+
+
+@pytest.fixture(scope="module")
+def pqc_server():
+    """Build one server for the module; SSL setup does not mutate it."""
+    return Server(server_id="test-server")
+
+
 class TestPQCDetection:
     """Test PQC library detection and availability."""
     
@@ -41,7 +97,7 @@ class TestPQCDetection:
         """Test getting OQS library path."""
         path = get_oqs_openssl_path()
         # Path may be None if PQC not installed, which is valid
-        assert path is None or path.exists()
+        assert path is None or os.path.exists(path)
     
     def test_supported_groups(self):
         """Test getting supported Kyber groups."""
@@ -58,7 +114,7 @@ class TestHybridTLSConfig:
     
     def test_default_config(self):
         """Test default configuration values."""
-        config = HybridTLSConfig()
+        config = DEFAULT_CONFIG
         
         assert config.kyber_variant == 768
         assert config.classical_curve == "x25519"
@@ -69,12 +125,7 @@ class TestHybridTLSConfig:
     
     def test_custom_config(self):
         """Test custom configuration."""
-        config = HybridTLSConfig(
-            kyber_variant=1024,
-            classical_curve="x25519",
-            verify_mode=ssl.CERT_NONE,
-            check_hostname=False
-        )
+        config = CUSTOM_CONFIG
         
         assert config.kyber_variant == 1024
         assert config.classical_curve == "x25519"
@@ -82,137 +133,85 @@ class TestHybridTLSConfig:
         assert config.check_hostname is False
 
 
+@requires_pqc
 class TestSSLContextCreation:
     """Test SSL context creation with PQC."""
     
-    def test_create_quantum_safe_context_basic(self):
-        """Test creating a quantum-safe SSL context."""
-        result = verify_kyber_support()
-        
-        if not result["available"]:
-            pytest.skip("PQC libraries not available")
-        
-        context = create_quantum_safe_context()
-        
-        assert isinstance(context, ssl.SSLContext)
-        assert context.minimum_version == ssl.TLSVersion.TLSv1_3
-    
-    def test_create_quantum_safe_context_no_verify(self):
-        """Test creating context without SSL verification."""
-        result = verify_kyber_support()
-        
-        if not result["available"]:
-            pytest.skip("PQC libraries not available")
-        
-        context = create_quantum_safe_context(verify_ssl=False)
-        
-        assert isinstance(context, ssl.SSLContext)
-        assert context.check_hostname is False
-        assert context.verify_mode == ssl.CERT_NONE
-    
-    def test_create_hybrid_ssl_context_default(self):
-        """Test creating hybrid SSL context with defaults."""
-        result = verify_kyber_support()
-        
-        if not result["available"]:
-            pytest.skip("PQC libraries not available")
-        
-        context = create_hybrid_ssl_context()
-        
-        assert isinstance(context, ssl.SSLContext)
-        assert context.minimum_version == ssl.TLSVersion.TLSv1_3
-    
-    def test_create_hybrid_ssl_context_custom_config(self):
-        """Test creating hybrid SSL context with custom config."""
-        result = verify_kyber_support()
-        
-        if not result["available"]:
-            pytest.skip("PQC libraries not available")
-        
-        config = HybridTLSConfig(
-            kyber_variant=512,
-            classical_curve="x25519"
-        )
-        context = create_hybrid_ssl_context(config)
+    @pytest.mark.parametrize(
+        "factory, kwargs, expected",
+        [
+            pytest.param(
+                create_quantum_safe_context,
+                {},
+                {"minimum_version": ssl.TLSVersion.TLSv1_3},
+                id="quantum_safe_default"
+            ),
+            pytest.param(
+                create_quantum_safe_context,
+                {"verify_ssl": False},
+                {
+                    "minimum_version": ssl.TLSVersion.TLSv1_3,
+                    "check_hostname": False,
+                    "verify_mode": ssl.CERT_NONE
+                },
+                id="quantum_safe_no_verify"
+            ),
+            pytest.param(
+                create_hybrid_ssl_context,
+                {},
+                {"minimum_version": ssl.TLSVersion.TLSv1_3},
+                id="hybrid_default"
+            ),
+            pytest.param(
+                create_hybrid_ssl_context,
+                {"config": KYBER512_CONFIG},
+                {"minimum_version": ssl.TLSVersion.TLSv1_3},
+                id="hybrid_custom_config"
+            ),
+        ]
+    )
+    def test_create_context(self, factory, kwargs, expected):
+        """Test creating SSL contexts through each factory and config."""
+        context = factory(**kwargs)
         
         assert isinstance(context, ssl.SSLContext)
+        for attr, value in expected.items():
+            assert getattr(context, attr) == value
 
 
 class TestClientPQC:
     """Test PQC integration with ARCClient."""
     
-    @pytest.mark.asyncio
-    async def test_client_with_pqc_available(self):
-        """Test client uses PQC when available."""
-        from arc import Client
-        
-        result = verify_kyber_support()
-        
-        if not result["available"]:
-            pytest.skip("PQC libraries not available")
-        
-        client = Client(
-            endpoint="https://example.com",
-            token="test-token",
-            use_quantum_safe=True
-        )
-        
-        # Should have SSL context configured
-        assert client.http_client is not None
-        
-        await client.close()
+    def test_client_ssl_configured(self, pqc_client):
+        """Test client builds its HTTP client with and without PQC."""
+        # Should have SSL context configured (hybrid or standard TLS)
+        assert pqc_client.http_client is not None
     
-    @pytest.mark.asyncio
-    async def test_client_without_pqc(self):
+    def test_client_without_pqc(self, monkeypatch, client_loop):
         """Test client falls back gracefully when PQC not available."""
-        from arc import Client
-        
         # Mock PQC as unavailable
-        with patch('arc.client.arc_client.QUANTUM_SAFE_AVAILABLE', False):
-            client = Client(
-                endpoint="https://example.com",
-                token="test-token",
-                use_quantum_safe=True
-            )
-            
-            # Should still work with standard TLS
-            assert client.http_client is not None
-            
-            await client.close()
-    
-    @pytest.mark.asyncio
-    async def test_client_pqc_disabled(self):
-        """Test client with PQC explicitly disabled."""
-        from arc import Client
-        
+        monkeypatch.setattr('arc.client.arc_client.QUANTUM_SAFE_AVAILABLE', False)
         client = Client(
             endpoint="https://example.com",
             token="test-token",
-            use_quantum_safe=False
+            use_quantum_safe=True
         )
         
-        # Should work with standard TLS
-        assert client.http_client is not None
-        
-        await client.close()
+        try:
+            # Should still work with standard TLS
+            assert client.http_client is not None
+        finally:
+            client_loop.run_until_complete(client.close())
 
 
 class TestServerPQC:
     """Test PQC integration with ARCServer."""
     
-    def test_server_ssl_setup_with_pqc(self):
+    @requires_pqc
+    def test_server_ssl_setup_with_pqc(self, pqc_server):
         """Test server SSL setup with PQC available."""
-        from arc import Server
-        
-        result = verify_kyber_support()
-        
-        if not result["available"]:
-            pytest.skip("PQC libraries not available")
-        
-        server = Server(server_id="test-server")
-        
         # Mock SSL files
-        ssl_config = server._setup_ssl_for_server(
+        ssl_config = pqc_server._setup_ssl_for_server(
             ssl_context=None,
             use_quantum_safe=True,
             hybrid_tls_config=None,
@@ -224,25 +223,21 @@ class TestServerPQC:
         # Should return SSL context or config dict
         assert ssl_config is not None
     
-    def test_server_ssl_setup_without_pqc(self):
+    def test_server_ssl_setup_without_pqc(self, pqc_server, monkeypatch):
         """Test server SSL setup without PQC."""
-        from arc import Server
-        
-        server = Server(server_id="test-server")
-        
         # Mock PQC as unavailable
-        with patch('arc.server.arc_server.QUANTUM_SAFE_AVAILABLE', False):
-            ssl_config = server._setup_ssl_for_server(
-                ssl_context=None,
-                use_quantum_safe=True,
-                hybrid_tls_config=None,
-                ssl_keyfile="/fake/key.pem",
-                ssl_certfile="/fake/cert.pem",
-                ssl_ca_certs=None
-            )
-            
-            # Should fall back to standard SSL config
-            assert ssl_config is not None
+        monkeypatch.setattr('arc.server.arc_server.QUANTUM_SAFE_AVAILABLE', False)
+        ssl_config = pqc_server._setup_ssl_for_server(
+            ssl_context=None,
+            use_quantum_safe=True,
+            hybrid_tls_config=None,
+            ssl_keyfile="/fake/key.pem",
+            ssl_certfile="/fake/cert.pem",
+            ssl_ca_certs=None
+        )
+        
+        # Should fall back to standard SSL config
+        assert ssl_config is not None
 
 
 class TestHybridKEXGroups:
@@ -254,40 +249,43 @@ class TestHybridKEXGroups:
         assert len(HYBRID_KEX_GROUPS) > 0
         
         # Check for expected groups
-        expected_groups = [
+        expected_groups = {
             "p256_kyber512",
             "p256_kyber768",
             "p256_kyber1024",
             "x25519_kyber512",
             "x25519_kyber768",
             "x25519_kyber1024"
-        ]
+        }
         
-        for group in expected_groups:
-            assert group in HYBRID_KEX_GROUPS
+        assert expected_groups <= HYBRID_KEX_GROUPS.keys()
 
 
 class TestPQCFallback:
     """Test graceful fallback behavior."""
     
-    @pytest.mark.asyncio
-    async def test_client_fallback_on_error(self):
+    def test_client_fallback_on_error(self, monkeypatch, client_loop):
         """Test client falls back when PQC context creation fails."""
-        from arc import Client
+        def failing_context(*args, **kwargs):
+            raise Exception("Test error")
         
         # Mock create_quantum_safe_context to raise an error
-        with patch('arc.client.arc_client.create_quantum_safe_context', side_effect=Exception("Test error")):
-            with patch('arc.client.arc_client.QUANTUM_SAFE_AVAILABLE', True):
-                client = Client(
-                    endpoint="https://example.com",
-                    token="test-token",
-                    use_quantum_safe=True
-                )
-                
-                # Should still work with fallback
-                assert client.http_client is not None
-                
-                await client.close()
+        monkeypatch.setattr(
+            'arc.client.arc_client.create_quantum_safe_context',
+            failing_context
+        )
+        monkeypatch.setattr('arc.client.arc_client.QUANTUM_SAFE_AVAILABLE', True)
+        client = Client(
+            endpoint="https://example.com",
+            token="test-token",
+            use_quantum_safe=True
+        )
+        
+        try:
+            # Should still work with fallback
+            assert client.http_client is not None
+        finally:
+            client_loop.run_until_complete(client.close())
 
 
 if __name__ == "__main__":